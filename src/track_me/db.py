@@ -16,6 +16,7 @@ import sqlite3
 from dataclasses import dataclass, field, fields
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Iterable, Iterator
 from zoneinfo import ZoneInfo
 
 import h3
@@ -73,6 +74,16 @@ _MEDIA_COLUMNS = (
     "created_at",
     "updated_at",
 )
+# Shared by the single-row and batched media upserts below.
+_MEDIA_UPSERT_SQL = (
+    f"INSERT INTO media ({', '.join(_MEDIA_COLUMNS)}) "
+    f"VALUES ({', '.join(f':{c}' for c in _MEDIA_COLUMNS)}) "
+    "ON CONFLICT(dedupe_key) DO UPDATE SET "
+    + ", ".join(
+        f"{c} = excluded.{c}" for c in _MEDIA_COLUMNS if c not in ("dedupe_key", "created_at")
+    )
+)
+
 _PLACE_COLUMNS = (
     "h3_cell",
     "center_lat",
@@ -301,6 +312,13 @@ class Database:
         self.conn = sqlite3.connect(str(self.path))
         self.conn.row_factory = sqlite3.Row
         self.conn.execute("PRAGMA foreign_keys = ON")
+        # Write-path tuning: WAL lets the viewer read while an ingest commits,
+        # and synchronous=NORMAL drops the fsync-per-commit that dominates
+        # batched imports (still durable against app crashes; WAL recovers).
+        # journal_mode is persistent, but read-only/immutable opens (the
+        # deployed viewer) handle a WAL-mode file fine; :memory: ignores it.
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
 
     @classmethod
     def read_only(cls, path: str | Path, *, immutable: bool = False) -> Database:
@@ -338,32 +356,38 @@ class Database:
         row = self.conn.execute("SELECT * FROM media WHERE dedupe_key = ?", (key,)).fetchone()
         return _media_from_row(row) if row else None
 
-    def upsert_media(self, m: Media) -> Media:
-        """Insert or update by dedupe_key. Stamps created_at/updated_at and
-        keeps local_date in sync; created_at is preserved on update."""
-        now = now_utc()
+    @staticmethod
+    def _stamp_for_write(m: Media, now: datetime) -> None:
+        """Pre-write bookkeeping shared by the upsert paths."""
         if m.created_at is None:
             m.created_at = now
         m.updated_at = now
         if m.local_date is None and m.taken_at is not None:
             m.refresh_local_date()
 
-        params = _media_to_params(m)
-        cols = ", ".join(_MEDIA_COLUMNS)
-        placeholders = ", ".join(f":{c}" for c in _MEDIA_COLUMNS)
-        updates = ", ".join(
-            f"{c} = excluded.{c}" for c in _MEDIA_COLUMNS if c not in ("dedupe_key", "created_at")
-        )
-        self.conn.execute(
-            f"INSERT INTO media ({cols}) VALUES ({placeholders}) "
-            f"ON CONFLICT(dedupe_key) DO UPDATE SET {updates}",
-            params,
-        )
+    def upsert_media(self, m: Media) -> Media:
+        """Insert or update by dedupe_key. Stamps created_at/updated_at and
+        keeps local_date in sync; created_at is preserved on update."""
+        self._stamp_for_write(m, now_utc())
+        self.conn.execute(_MEDIA_UPSERT_SQL, _media_to_params(m))
         self.conn.commit()
         got = self.get_media_by_dedupe_key(m.dedupe_key)
         assert got is not None
         return got
 
+    def upsert_media_many(self, items: list[Media]) -> None:
+        """Batched :meth:`upsert_media`: the same ON CONFLICT merge, but one
+        executemany + one commit for the whole batch and no per-row read-back.
+        Row order is preserved, so a later duplicate key wins as it would
+        with sequential single-row upserts."""
+        if not items:
+            return
+        now = now_utc()
+        for m in items:
+            self._stamp_for_write(m, now)
+        self.conn.executemany(_MEDIA_UPSERT_SQL, [_media_to_params(m) for m in items])
+        self.conn.commit()
+
     def set_geo_cell(self, dedupe_key: str, geo_cell: str | None) -> None:
         self.conn.execute(
             "UPDATE media SET geo_cell = ?, updated_at = ? WHERE dedupe_key = ?",
@@ -380,9 +404,11 @@ class Database:
         )
         self.conn.commit()
 
-    def iter_located(self, year: int | None = None) -> list[Media]:
+    def iter_located(self, year: int | None = None) -> Iterator[Media]:
         """Located items with a timestamp, ordered by absolute UTC time.
 
+        A true iterator: rows stream off the cursor one at a time, so peak
+        memory stays O(1) Media instances however large the catalog gets.
         ``year`` filters on the photo's LOCAL year (via ``local_date``)."""
         sql = "SELECT * FROM media WHERE latitude IS NOT NULL AND taken_at IS NOT NULL "
         params: list = []
@@ -390,7 +416,8 @@ class Database:
             sql += "AND substr(local_date, 1, 4) = ? "
             params.append(str(year))
         sql += "ORDER BY taken_at"
-        return [_media_from_row(r) for r in self.conn.execute(sql, params)]
+        for row in self.conn.execute(sql, params):
+            yield _media_from_row(row)
 
     def media_pending_geocode(self, recalculate: bool = False) -> list[Media]:
         """Located items whose geo_cell is not yet set (or all located)."""
@@ -400,6 +427,28 @@ class Database:
         sql += "ORDER BY taken_at"
         return [_media_from_row(r) for r in self.conn.execute(sql)]
 
+    def pending_geocode_keys(self, recalculate: bool = False) -> list[tuple[str, str | None]]:
+        """(dedupe_key, h3_cell) pairs for located items pending geocode.
+
+        The only two columns the geocoder needs — the wide rows (JSON blobs
+        included) stay in SQLite. Ordered by time, like the full fetch."""
+        sql = "SELECT dedupe_key, h3_cell FROM media WHERE latitude IS NOT NULL "
+        if not recalculate:
+            sql += "AND geo_cell IS NULL "
+        sql += "ORDER BY taken_at"
+        return [(r["dedupe_key"], r["h3_cell"]) for r in self.conn.execute(sql)]
+
+    def pending_geocode_cell_counts(self, recalculate: bool = False) -> dict[str | None, int]:
+        """Item count per res-11 cell for located items pending geocode.
+
+        One aggregate scan — no Media rows (or their JSON blobs) are
+        materialized. A ``None`` key collects located items with no cell."""
+        sql = "SELECT h3_cell, COUNT(*) AS n FROM media WHERE latitude IS NOT NULL "
+        if not recalculate:
+            sql += "AND geo_cell IS NULL "
+        sql += "GROUP BY h3_cell"
+        return {r["h3_cell"]: r["n"] for r in self.conn.execute(sql)}
+
     def count_media(self, located_only: bool = False) -> int:
         sql = "SELECT COUNT(*) FROM media"
         if located_only:
@@ -411,6 +460,21 @@ class Database:
         row = self.conn.execute("SELECT * FROM place WHERE h3_cell = ?", (h3_cell,)).fetchone()
         return _place_from_row(row) if row else None
 
+    def get_places(self, h3_cells: Iterable[str]) -> dict[str, Place]:
+        """Fetch many places in one go, keyed by cell. Missing cells are simply
+        absent from the result. Chunked ``IN`` queries keep well under SQLite's
+        bound-parameter limit."""
+        cells = list(h3_cells)
+        out: dict[str, Place] = {}
+        for i in range(0, len(cells), 500):
+            chunk = cells[i : i + 500]
+            placeholders = ", ".join("?" * len(chunk))
+            for row in self.conn.execute(
+                f"SELECT * FROM place WHERE h3_cell IN ({placeholders})", chunk
+            ):
+                out[row["h3_cell"]] = _place_from_row(row)
+        return out
+
     def upsert_place(self, p: Place) -> None:
         params = _place_to_params(p)
         cols = ", ".join(_PLACE_COLUMNS)
@@ -438,10 +502,18 @@ class Database:
         self.conn.commit()
 
     # --- join (timeline / export) ---------------------------------------
-    def located_with_place(self, year: int | None = None) -> list[dict]:
+    def located_with_place(
+        self,
+        year: int | None = None,
+        start: str | None = None,
+        end: str | None = None,
+    ) -> list[sqlite3.Row]:
         """Located items joined to their place names, ordered by time.
 
-        Returns plain dicts with the fields timeline/export consume."""
+        ``start``/``end`` bound ``taken_at`` as a [start, end) window — plain
+        ISO text comparison, done in SQL so out-of-window rows never cross into
+        Python. Returns ``sqlite3.Row`` objects (read-only, dict-style access
+        by column name) — no per-row dict is allocated."""
         sql = (
             "SELECT m.taken_at, m.local_date, m.latitude, m.longitude, m.timezone, "
             "m.google_photos_url, p.city, p.admin1, p.country_code, p.formatted_address "
@@ -452,8 +524,14 @@ class Database:
         if year is not None:
             sql += "AND substr(m.local_date, 1, 4) = ? "
             params.append(str(year))
+        if start is not None:
+            sql += "AND m.taken_at >= ? "
+            params.append(start)
+        if end is not None:
+            sql += "AND m.taken_at < ? "
+            params.append(end)
         sql += "ORDER BY m.taken_at"
-        return [dict(r) for r in self.conn.execute(sql, params)]
+        return list(self.conn.execute(sql, params))
 
 
 # guard against dataclass/columns drift
@@ -61,4 +61,5 @@ def located_items(db: Database, year: int | None = None) -> list[Media]:
     ``year`` filters on the photo's LOCAL year (via ``local_date``) so a photo
     taken near midnight abroad lands in the correct year.
     """
-    return db.iter_located(year=year)
+    # Materialized: the CLI indexes the ends for the date-span summary.
+    return list(db.iter_located(year=year))
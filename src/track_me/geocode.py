@@ -19,13 +19,14 @@ from __future__ import annotations
 
 import logging
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from typing import Any
 
 import h3
 
 from track_me import config
-from track_me.db import Database, Place, now_utc
+from track_me.db import H3_BASE_RESOLUTION, Database, Place, now_utc
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +34,11 @@ logger = logging.getLogger(__name__)
 # single label covers a wider area. res 9 ~ 0.1 km^2 (neighbourhood).
 DEFAULT_GEOCODE_RESOLUTION = 9
 
+# Concurrent reverse-geocode fetches. Wall time is dominated by round-trip
+# latency, so a small pool gives a near-linear win; kept modest to stay polite
+# to the API (cf. ingest's DEFAULT_WORKERS, which is I/O on our own store).
+FETCH_WORKERS = 8
+
 # No single Google component type is "the city" worldwide; try these in order.
 CITY_TYPE_PRIORITY = (
     "locality",
@@ -43,6 +49,15 @@ CITY_TYPE_PRIORITY = (
 )
 
 
+def _cell_at(base_cell: str | None, resolution: int) -> str | None:
+    """Parent of a media res-11 cell at the geocode resolution (cf. Media.geo_cell_at)."""
+    if not base_cell:
+        return None
+    if resolution >= H3_BASE_RESOLUTION:
+        return base_cell
+    return h3.cell_to_parent(base_cell, resolution)
+
+
 def _component(components: list[dict], type_name: str, key: str = "long_name") -> str | None:
     for comp in components or []:
         if type_name in comp.get("types", []):
@@ -68,15 +83,22 @@ def derive_place(components: list[dict]) -> tuple[str | None, str | None]:
 def estimate_calls(
     db: Database, resolutions: list[int], recalculate: bool = False
 ) -> tuple[int, dict[int, int]]:
-    """Distinct H3 cells (= API calls) per resolution, without any API call."""
-    pending = db.media_pending_geocode(recalculate)
-    sets: dict[int, set] = {r: set() for r in resolutions}
-    for m in pending:
-        for r in resolutions:
-            cell = m.geo_cell_at(r)
-            if cell:
-                sets[r].add(cell)
-    return len(pending), {r: len(s) for r, s in sets.items()}
+    """Distinct H3 cells (= API calls) per resolution, without any API call.
+
+    Parents are derived from the *distinct* res-11 cells, not per item — many
+    photos share a cell, so this does len(cells) cell_to_parent calls per
+    resolution instead of len(items). The cell counts come from a single
+    aggregate query; no Media rows are materialized."""
+    cell_counts = db.pending_geocode_cell_counts(recalculate)
+    total = sum(cell_counts.values())
+    base_cells = {c for c in cell_counts if c is not None}
+    counts: dict[int, int] = {}
+    for r in resolutions:
+        if r >= H3_BASE_RESOLUTION:
+            counts[r] = len(base_cells)
+        else:
+            counts[r] = len({h3.cell_to_parent(c, r) for c in base_cells})
+    return total, counts
 
 
 @dataclass
@@ -140,34 +162,74 @@ class Geocoder:
         max_api_calls: int | None = None,
     ) -> GeocodeStats:
         stats = GeocodeStats()
-        pending = self.db.media_pending_geocode(recalculate)
+        # Narrow fetch: only (dedupe_key, h3_cell) — the geocoder never touches
+        # the wide media rows.
+        pending = self.db.pending_geocode_keys(recalculate)
         stats.total_items = len(pending)
         if not pending:
             self.progress("No items to geocode")
             return stats
 
-        groups: dict[str, list] = defaultdict(list)
-        for m in pending:
-            cell = m.geo_cell_at(resolution)
+        groups: dict[str, list[str]] = defaultdict(list)
+        for key, base_cell in pending:
+            cell = _cell_at(base_cell, resolution)
             if cell:
-                groups[cell].append(m)
+                groups[cell].append(key)
         self.progress(
             f"Geocoding {stats.total_items} items in {len(groups)} H3 cells "
             f"(resolution {resolution})"
         )
 
-        for cell, items in groups.items():
-            existing = self.db.get_place(cell)
+        # One bulk read instead of a SELECT per cell.
+        places = self.db.get_places(groups)
+
+        # Split the cells: already-fetched ones just need their photos linked;
+        # the rest each cost one API call, capped by max_api_calls.
+        to_fetch: list[str] = []
+        link_only: list[str] = []
+        for cell in groups:
+            existing = places.get(cell)
             if existing is None or existing.geocode_raw is None or recalculate:
-                # Need an API call for this cell.
-                if max_api_calls is not None and stats.api_calls >= max_api_calls:
-                    self.progress(f"Reached API call limit ({max_api_calls}); stopping.")
-                    break
-                lat, lon = h3.cell_to_latlng(cell)
-                info = self.reverse_geocode(lat, lon)
+                to_fetch.append(cell)
+            else:
+                link_only.append(cell)
+        if max_api_calls is not None and len(to_fetch) > max_api_calls:
+            self.progress(
+                f"Reached API call limit ({max_api_calls}); "
+                f"leaving {len(to_fetch) - max_api_calls} cells pending."
+            )
+            to_fetch = to_fetch[:max_api_calls]
+
+        # Photo->place links accumulate across cells and are written once at
+        # the end (one executemany + commit instead of one per cell). Losing
+        # them on a crash is cheap: place rows are committed as fetched, so a
+        # re-run re-links without further API calls.
+        links: list[tuple[str, str]] = []
+
+        for cell in link_only:
+            links.extend((key, cell) for key in groups[cell])
+            stats.processed += len(groups[cell])
+
+        # Fetches run concurrently (wall time here is pure API round-trip);
+        # the main thread stays the sole SQLite writer, like the ingest
+        # pipeline. googlemaps.Client rides one shared requests.Session,
+        # which is safe for concurrent GETs.
+        def fetch(cell: str) -> tuple[str, float, float, dict | None]:
+            lat, lon = h3.cell_to_latlng(cell)
+            return cell, lat, lon, self.reverse_geocode(lat, lon)
+
+        if not to_fetch:
+            self.db.set_geo_cells(links)
+            return stats
+        self.client  # build once up front: fail fast on a missing key, not in a worker
+        with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(to_fetch))) as pool:
+            futures = [pool.submit(fetch, cell) for cell in to_fetch]
+            for fut in as_completed(futures):
+                cell, lat, lon, info = fut.result()
                 stats.api_calls += 1
+                keys = groups[cell]
                 if not info:
-                    stats.skipped += len(items)
+                    stats.skipped += len(keys)
                     continue
                 city, admin1 = derive_place(info["components"])
                 self.db.upsert_place(
@@ -183,13 +245,16 @@ class Geocoder:
                         geocoded_at=now_utc(),
                     )
                 )
-            # Link every photo in the cell (place row now exists).
-            self.db.set_geo_cells([(m.dedupe_key, cell) for m in items])
-            stats.processed += len(items)
+                # Queue every photo in the cell (place row now exists).
+                links.extend((key, cell) for key in keys)
+                stats.processed += len(keys)
 
-            if stats.api_calls and stats.api_calls % 10 == 0:
-                self.progress(f"{stats.processed}/{stats.total_items} ({stats.api_calls} calls)")
+                if stats.api_calls % 10 == 0:
+                    self.progress(
+                        f"{stats.processed}/{stats.total_items} ({stats.api_calls} calls)"
+                    )
 
+        self.db.set_geo_cells(links)
         return stats
 
     # --- derive (offline, free) ------------------------------------------
@@ -24,6 +24,22 @@ logger = logging.getLogger(__name__)
 IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".heic", ".heif", ".webp", ".tiff", ".gif", ".bmp"}
 VIDEO_EXTENSIONS = {".mp4", ".mov", ".m4v", ".3gp", ".avi", ".mkv", ".webm"}
 
+# Magic numbers for the supported image formats (JPEG, PNG, TIFF both orders,
+# GIF, BMP); WebP and the HEIC/HEIF ISO-BMFF family need positional checks.
+_MAGIC_PREFIXES = (b"\xff\xd8\xff", b"\x89PNG\r\n\x1a\n", b"II*\x00", b"MM\x00*", b"GIF8", b"BM")
+
+
+def looks_like_image(data: bytes) -> bool:
+    """Cheap magic-number sniff: real-world exports contain junk with image
+    extensions (camera .THM siblings renamed, partial downloads), and
+    rejecting it on the first bytes beats raising through the decoder."""
+    head = data[:16]
+    if head.startswith(_MAGIC_PREFIXES):
+        return True
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return True
+    return head[4:8] == b"ftyp"  # HEIC/HEIF (ISO base media container)
+
 
 @dataclass
 class ExifData:
@@ -68,15 +84,16 @@ def _parse_coordinate(coordinate) -> float | None:
         return float(coordinate)
     if isinstance(coordinate, (tuple, list)) and len(coordinate) == 3:
         d, m, s = coordinate
-        return float(d) + float(m) / 60 + float(s) / 3600
+        # Fused to one division; also slightly kinder to rounding than
+        # summing three separately-divided terms.
+        return (float(d) * 3600.0 + float(m) * 60.0 + float(s)) / 3600.0
     return None
 
 
-def _read_meta(data: bytes) -> dict:
+def _read_meta(img: Image.Image) -> dict:
     """Extract EXIF tags (incl. GPS IFD) into a JSON-serializable dict."""
     try:
-        with Image.open(BytesIO(data)) as img:
-            exif_data = img.getexif()
+        exif_data = img.getexif()
     except Exception as e:
         logger.warning("Could not read EXIF: %s", e)
         return {}
@@ -130,10 +147,9 @@ def _datetime_text(meta: dict) -> str | None:
     return None
 
 
-def _perceptual_hash(data: bytes) -> str | None:
+def _perceptual_hash(img: Image.Image) -> str | None:
     try:
-        with Image.open(BytesIO(data)) as img:
-            return str(imagehash.phash(img))
+        return str(imagehash.phash(img))
     except Exception as e:
         logger.warning("Could not hash image: %s", e)
         return None
@@ -142,13 +158,26 @@ def _perceptual_hash(data: bytes) -> str | None:
 def read_exif(data: bytes, *, with_hash: bool = False) -> ExifData:
     """Read EXIF metadata, GPS, capture time, and (optionally) perceptual hash
     from raw image bytes. ``with_hash`` forces a full decode, so leave it off
-    unless the hash is actually needed for identity."""
-    meta = _read_meta(data)
+    unless the hash is actually needed for identity.
+
+    One ``Image.open`` serves both: EXIF comes off the header parse, and the
+    (optional) hash reuses the same handle for the pixel decode."""
+    if not looks_like_image(data):
+        logger.warning("Not a recognized image format (magic bytes); skipping EXIF")
+        return ExifData()
+    try:
+        img = Image.open(BytesIO(data))
+    except Exception as e:
+        logger.warning("Could not read image: %s", e)
+        return ExifData()
+    with img:
+        meta = _read_meta(img)
+        phash = _perceptual_hash(img) if with_hash else None
     coords, altitude = _extract_gps(meta)
     return ExifData(
         meta=meta,
         coords=coords,
         altitude=altitude,
         datetime_text=_datetime_text(meta),
-        perceptual_hash=_perceptual_hash(data) if with_hash else None,
+        perceptual_hash=phash,
     )
@@ -21,6 +21,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime
 from datetime import timezone as dt_timezone
+from zoneinfo import ZoneInfo
 
 from track_me import config
 from track_me.db import Database, LocationSource, Media, MediaKind, TimeSource, from_iso, now_utc
@@ -36,6 +37,10 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_WORKERS = 32
 
+# Resolved media are written in batches of this many rows (one executemany +
+# commit each) instead of a commit per photo.
+WRITE_BATCH = 200
+
 
 @dataclass
 class IngestStats:
@@ -87,6 +92,15 @@ def _kind_for(ext: str) -> str | None:
     return None
 
 
+def _is_media_name(name: str) -> bool:
+    """True for names worth ingesting. macOS AppleDouble siblings ("._IMG.jpg")
+    share the photo's extension but hold resource-fork bytes, so they'd be
+    downloaded whole only to fail decoding — drop them here, before any read."""
+    if name.startswith("._"):
+        return False
+    return _kind_for(os.path.splitext(name)[1].lower()) is not None
+
+
 _YEAR_DIR_RE = re.compile(r"Photos from (\d{4})$")
 
 
@@ -166,8 +180,8 @@ def _resolve_taken_at(
         if naive is not None:
             if tz:
                 try:
-                    from zoneinfo import ZoneInfo
-
+                    # ZoneInfo instances are cached by key in the stdlib, so
+                    # this is a dict hit per photo, not a tzdata parse.
                     aware = naive.replace(tzinfo=ZoneInfo(tz)).astimezone(dt_timezone.utc)
                     return aware, TimeSource.EXIF
                 except Exception:
@@ -200,6 +214,7 @@ class IngestPipeline:
             size=thumbnail_size or config.THUMBNAIL_SIZE,
         )
         self._date_filter: tuple[str, str] | None = None
+        self._write_buf: list[Media] = []
 
     # --- public API ------------------------------------------------------
     def ingest(
@@ -224,7 +239,7 @@ class IngestPipeline:
         for obj in store.list(prefix):
             directory, _, name = obj.key.rpartition("/")
             files_by_dir.setdefault(directory, []).append(name)
-            if _kind_for(os.path.splitext(name)[1].lower()) is None:
+            if not _is_media_name(name):
                 continue
             total_media += 1
             # Coarse, zero-I/O pre-filter: a 'Photos from YYYY' folder whose year is
@@ -258,6 +273,7 @@ class IngestPipeline:
             ]
             for fut in as_completed(futures):
                 self._apply(fut.result(), stats)
+        self._flush_writes()
 
         return stats
 
@@ -300,7 +316,9 @@ class IngestPipeline:
                 stats.error_details.append(res.error)
             return
         assert res.media is not None
-        self.db.upsert_media(res.media)
+        self._write_buf.append(res.media)
+        if len(self._write_buf) >= WRITE_BATCH:
+            self._flush_writes()
         setattr(stats, res.action, getattr(stats, res.action) + 1)
         if res.with_location:
             stats.with_location += 1
@@ -310,6 +328,11 @@ class IngestPipeline:
         if written % 100 == 0:
             self.progress(f"Inserted {written} photos...")
 
+    def _flush_writes(self) -> None:
+        """Write the buffered media rows (one batched upsert), main thread only."""
+        self.db.upsert_media_many(self._write_buf)
+        self._write_buf.clear()
+
     # --- worker (no DB access) -------------------------------------------
     def _resolve(
         self,
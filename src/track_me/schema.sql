@@ -72,3 +72,7 @@ CREATE INDEX IF NOT EXISTS idx_media_local_date ON media (local_date);
 CREATE INDEX IF NOT EXISTS idx_media_geo_cell   ON media (geo_cell);
 CREATE INDEX IF NOT EXISTS idx_media_h3_cell    ON media (h3_cell);
 CREATE INDEX IF NOT EXISTS idx_media_review     ON media (location_source, needs_review);
+-- Partial index for the incremental-geocode scan (located, not yet linked,
+-- ordered by time). Shrinks to nothing once a catalog is fully geocoded.
+CREATE INDEX IF NOT EXISTS idx_media_pending_geocode ON media (taken_at)
+    WHERE latitude IS NOT NULL AND geo_cell IS NULL;
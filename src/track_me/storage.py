@@ -52,15 +52,28 @@ class LocalStore:
             st = base.stat()
             yield ObjectInfo(base.relative_to(self.root).as_posix(), st.st_size)
             return
-        for dirpath, _dirs, filenames in os.walk(base):
-            for name in filenames:
-                p = Path(dirpath) / name
-                try:
-                    st = p.stat()
-                except OSError:
-                    continue
-                key = p.relative_to(self.root).as_posix()
-                yield ObjectInfo(key, st.st_size, _mtime(st.st_mtime))
+        # scandir walk: DirEntry.stat() is served from the directory read on
+        # Linux, so listing costs one getdents per dir — no stat per file.
+        root = str(self.root)
+        stack = [str(base)]
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                    if not entry.is_file():
+                        continue  # broken symlink, fifo, ...
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    key = os.path.relpath(entry.path, root).replace(os.sep, "/")
+                    yield ObjectInfo(key, st.st_size, _mtime(st.st_mtime))
 
     def read(self, key: str) -> bytes:
         return self._abs(key).read_bytes()
@@ -43,6 +43,7 @@ class ThumbnailService:
 
         try:
             with Image.open(source_path) as img:
+                self._draft(img)
                 img = self._flatten(img)
                 img.thumbnail(self.size, Image.Resampling.LANCZOS)
                 img.save(dest, "JPEG", quality=85, optimize=True)
@@ -60,6 +61,7 @@ class ThumbnailService:
             return dest
         try:
             with Image.open(BytesIO(data)) as img:
+                self._draft(img)
                 img = self._flatten(img)
                 img.thumbnail(self.size, Image.Resampling.LANCZOS)
                 img.save(dest, "JPEG", quality=85, optimize=True)
@@ -68,6 +70,15 @@ class ThumbnailService:
             return None
         return dest
 
+    def _draft(self, img: Image.Image) -> None:
+        """Ask the decoder for a reduced-scale decode (JPEG DCT scaling).
+
+        Must run before any pixel access. Decoding at ~2x the target keeps
+        LANCZOS quality while skipping most of the IDCT work on big camera
+        JPEGs; a no-op for formats without draft support (PNG, HEIC, ...).
+        """
+        img.draft(None, (self.size[0] * 2, self.size[1] * 2))
+
     @staticmethod
     def _flatten(img: Image.Image) -> Image.Image:
         """Composite transparency onto white so it can be saved as JPEG."""
@@ -40,10 +40,9 @@ def load_points(
     db = db or Database(config.DB_PATH)
     region_set = {c.upper() for c in region} if region else None
     points: list[dict] = []
-    for r in db.located_with_place():  # already ordered by taken_at
+    # The [start, end) window is applied in SQL; already ordered by taken_at.
+    for r in db.located_with_place(start=start, end=end):
         ta = r["taken_at"]
-        if ta is None or not (start <= ta < end):
-            continue
         if region_set is not None and r["country_code"] not in region_set:
             continue
         points.append(
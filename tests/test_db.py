@@ -10,8 +10,9 @@ from track_me.db import Database, Media, Place, local_date_for
 
 
 @pytest.fixture
-def db(tmp_path):
-    database = Database(tmp_path / "t.db")
+def db():
+    # In-memory: these tests never reopen the DB by path, so skip the disk.
+    database = Database(":memory:")
     database.init_schema()
     yield database
     database.close()
@@ -120,6 +121,41 @@ def test_place_roundtrip_and_join(db):
     assert rows[0]["country_code"] == "FR"
 
 
+def test_upsert_media_many_batches(db):
+    db.upsert_media(Media(dedupe_key="k1", file_name="a.jpg"))
+    created = db.get_media_by_dedupe_key("k1").created_at
+
+    db.upsert_media_many(
+        [
+            Media(dedupe_key="k1", file_name="renamed.jpg"),  # update
+            Media(dedupe_key="k2", file_name="b.jpg"),  # insert
+        ]
+    )
+    assert db.count_media() == 2
+    assert db.get_media_by_dedupe_key("k1").file_name == "renamed.jpg"
+    assert db.get_media_by_dedupe_key("k1").created_at == created  # preserved
+    db.upsert_media_many([])  # no-op, no error
+
+
+def test_located_with_place_time_window(db):
+    db.upsert_media(_located("k1", datetime(2019, 5, 1, tzinfo=UTC), 40.0, -3.0))
+    db.upsert_media(_located("k2", datetime(2019, 6, 1, tzinfo=UTC), 41.0, -3.0))
+    db.upsert_media(_located("k3", datetime(2019, 7, 1, tzinfo=UTC), 42.0, -3.0))
+
+    rows = db.located_with_place(start="2019-05-15", end="2019-07-01")
+    assert [r["latitude"] for r in rows] == [41.0]  # [start, end) half-open
+    assert len(db.located_with_place(start="2019-05-01")) == 3  # start inclusive
+
+
+def test_get_places_bulk(db):
+    db.upsert_place(Place(h3_cell="c1", city="Paris"))
+    db.upsert_place(Place(h3_cell="c2", city="Lyon"))
+    got = db.get_places(["c1", "c2", "missing"])
+    assert set(got) == {"c1", "c2"}  # missing cells absent, not None
+    assert got["c2"].city == "Lyon"
+    assert db.get_places([]) == {}
+
+
 def test_derive_workflow(db):
     db.upsert_place(Place(h3_cell="c", geocode_raw=[{"x": 1}]))
     pending = db.places_pending_derive()
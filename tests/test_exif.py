@@ -1,6 +1,6 @@
 """Unit tests for EXIF GPS parsing (no image files needed)."""
 
-from track_me.ingest.exif import _extract_gps, _parse_coordinate
+from track_me.ingest.exif import _extract_gps, _parse_coordinate, looks_like_image, read_exif
 
 
 def test_parse_decimal_coordinate():
@@ -40,3 +40,19 @@ def test_extract_gps_with_hemisphere_refs():
 def test_extract_gps_absent():
     assert _extract_gps({}) == (None, None)
     assert _extract_gps({"GPSInfo": {"GPSLatitude": (1, 2, 3)}}) == (None, None)
+
+
+def test_looks_like_image_magics():
+    assert looks_like_image(b"\xff\xd8\xff\xe0rest-of-jpeg")
+    assert looks_like_image(b"\x89PNG\r\n\x1a\nrest")
+    assert looks_like_image(b"\x00\x00\x00\x18ftypheic...")
+    assert not looks_like_image(b"\x00\x05\x16\x07\x00\x02\x00\x00")  # AppleDouble
+    assert not looks_like_image(b"plain text")
+    assert not looks_like_image(b"")
+
+
+def test_read_exif_rejects_non_image_bytes():
+    data = read_exif(b"\x00\x05\x16\x07junk", with_hash=True)
+    assert data.meta == {}
+    assert data.coords is None
+    assert data.perceptual_hash is None
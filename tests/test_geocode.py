@@ -26,8 +26,9 @@ class _FakeClient:
 
 
 @pytest.fixture
-def db(tmp_path):
-    database = Database(tmp_path / "t.db")
+def db():
+    # In-memory: these tests never reopen the DB by path, so skip the disk.
+    database = Database(":memory:")
     database.init_schema()
     yield database
     database.close()
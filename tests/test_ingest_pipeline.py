@@ -102,6 +102,15 @@ def test_ingest_creates_items(db, thumbs_dir, takeout):
     assert db.count_media() == 3
 
 
+def test_appledouble_siblings_ignored(db, thumbs_dir, takeout, tmp_path):
+    # macOS resource forks share the photo's extension but aren't media.
+    root = tmp_path / "Takeout" / "Google Photos" / "Photos from 2019"
+    (root / "._IMG_1.JPG").write_bytes(b"\x00\x05\x16\x07\x00\x02\x00\x00")
+    stats = _pipeline(db, thumbs_dir).ingest(takeout)
+    assert stats.total_files == 3  # not even counted as media
+    assert stats.errors == 0
+
+
 def test_located_photo(db, thumbs_dir, takeout):
     _pipeline(db, thumbs_dir).ingest(takeout)
     item = _by_name(db, "IMG_1.JPG")
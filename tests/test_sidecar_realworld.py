@@ -57,9 +57,15 @@ def test_truncated_sidecar_matched_via_title():
     assert sc is not None and sc.coords() is not None
 
 
+@pytest.fixture(scope="module")
+def sidecars_matcher():
+    # Module-scoped: builds the directory index (and reads every sidecar JSON)
+    # once, instead of once per parametrized case.
+    return SidecarMatcher.for_local(SIDECARS)
+
+
 @pytest.mark.parametrize("name", ["DSCN0472.JPG", "DSCN0473.JPG", "DSCN0474.JPG"])
-def test_full_supplemental_naming_matches(name):
+def test_full_supplemental_naming_matches(sidecars_matcher, name):
     # The 2003 fixtures use full `.supplemental-metadata.json` naming.
-    matcher = SidecarMatcher.for_local(SIDECARS)
-    found = matcher.find(name)
+    found = sidecars_matcher.find(name)
     assert found == f"{name}.supplemental-metadata.json"
@@ -10,8 +10,9 @@ from track_me.db import Database, LocationSource, Media, Place
 
 
 @pytest.fixture
-def db(tmp_path):
-    database = Database(tmp_path / "t.db")
+def db():
+    # In-memory: these tests never reopen the DB by path, so skip the disk.
+    database = Database(":memory:")
     database.init_schema()
     yield database
     database.close()